@@ -10,6 +10,7 @@
 #    LICENSE file in the root directory of this source tree.
 ############################################################################
 
+import functools
 import math
 
 from abc import ABC, abstractmethod
@@ -22,7 +23,8 @@ from matplotlib.axes import Axes
 from matplotlib.figure import Figure
 from numpy import ndarray
 from scipy import sparse
-from scipy.sparse import coo_matrix, csc_matrix, dia_matrix
+from scipy.sparse import csc_matrix
+from scipy.sparse.linalg import LinearOperator
 
 import scqubits.core.constants as constants
 import scqubits.core.descriptors as descriptors
@@ -40,6 +42,85 @@ from scqubits.core.noise import NOISE_PARAMS, NoisySystem, calc_therm_ratio
 from scqubits.core.storage import WaveFunctionOnGrid
 
 
+def _reuse_evaluations(spectral_density: Callable) -> Callable:
+    r"""Wraps `spectral_density(omega, T)` so that repeated evaluations at the same
+    (scalar) frequency and temperature return the stored value. Used where several
+    noise channels share the same frequency dependence.
+
+    Parameters
+    ----------
+    spectral_density:
+        function of angular frequency `omega` and temperature `T`
+
+    Returns
+    -------
+        function with the same signature as `spectral_density`
+    """
+    values: Dict[Tuple[float, float], Any] = {}
+
+    def spectral_density_reused(omega, T):
+        if np.ndim(omega) != 0:
+            return spectral_density(omega, T)
+        key = (float(omega), T)
+        if key not in values:
+            values[key] = spectral_density(omega, T)
+        return values[key]
+
+    return spectral_density_reused
+
+
+@functools.lru_cache(maxsize=32)
+def _make_eye(dimension: int) -> csc_matrix:
+    r"""Returns the identity matrix of the given dimension in CSC format. The result is
+    shared between all callers and must not be modified.
+
+    Parameters
+    ----------
+    dimension:
+        matrix dimension
+
+    Returns
+    -------
+        identity matrix
+    """
+    return sparse.eye(dimension, format="csc")
+
+
+def _on_common_pattern(matrices: List[csc_matrix]) -> List[csc_matrix]:
+    r"""Returns the given sparse matrices in CSC format, all stored on the union of
+    their sparsity patterns (missing entries are stored as explicit zeros). Weighted
+    sums of the results can then be formed directly from their `data` arrays.
+
+    Parameters
+    ----------
+    matrices:
+        sparse matrices of equal shape
+
+    Returns
+    -------
+        list of CSC matrices sharing `indices` and `indptr`
+    """
+    matrices = [csc_matrix(matrix) for matrix in matrices]
+    for matrix in matrices:
+        matrix.sum_duplicates()
+    shape = matrices[0].shape
+    # combined (column-major) positions of all stored entries, in CSC order
+    positions = [
+        np.repeat(np.arange(shape[1]), np.diff(matrix.indptr)) * shape[0]
+        + matrix.indices
+        for matrix in matrices
+    ]
+    pattern = np.unique(np.concatenate(positions))
+    indptr = np.searchsorted(pattern, np.arange(shape[1] + 1) * shape[0])
+    indices = pattern % shape[0]
+    result = []
+    for matrix, position in zip(matrices, positions):
+        data = np.zeros(pattern.size, dtype=matrix.dtype)
+        data[np.searchsorted(pattern, position)] = matrix.data
+        result.append(csc_matrix((data, indices, indptr), shape=shape))
+    return result
+
+
 # - Cosine-2-phi qubit noise class ------------------------------------------
 class NoisyCos2PhiQubit(NoisySystem, ABC):
     """Abstract base class for incorporating noise in the Cos2PhiQubit.
@@ -225,21 +306,21 @@ class NoisyCos2PhiQubit(NoisySystem, ABC):
 
         if Q_ind is None:
             # See Smith et al (2020)
+            therm_ratio_500MHz = calc_therm_ratio(
+                2 * np.pi * 500e6, T, omega_in_standard_units=True
+            )
+            # reference term only depends on T, evaluate once for all omega
+            q_ind_500MHz = (
+                500e6
+                * sp.special.kv(0, 1 / 2 * therm_ratio_500MHz)
+                * np.sinh(1 / 2 * therm_ratio_500MHz)
+            )
+
             def q_ind_fun(omega):
-                therm_ratio = abs(calc_therm_ratio(omega, T))
-                therm_ratio_500MHz = calc_therm_ratio(
-                    2 * np.pi * 500e6, T, omega_in_standard_units=True
-                )
-                return (
-                    500e6
-                    * (
-                        sp.special.kv(0, 1 / 2 * therm_ratio_500MHz)
-                        * np.sinh(1 / 2 * therm_ratio_500MHz)
-                    )
-                    / (
-                        sp.special.kv(0, 1 / 2 * therm_ratio)
-                        * np.sinh(1 / 2 * therm_ratio)
-                    )
+                # elementwise numpy operations: omega may be a scalar or an ndarray
+                therm_ratio = np.abs(calc_therm_ratio(omega, T))
+                return q_ind_500MHz / (
+                    sp.special.kv(0, 1 / 2 * therm_ratio) * np.sinh(1 / 2 * therm_ratio)
                 )
 
         elif callable(Q_ind):  # Q_ind is a function of omega
@@ -249,9 +330,13 @@ class NoisyCos2PhiQubit(NoisySystem, ABC):
             def q_ind_fun(omega):
                 return Q_ind
 
-        def spectral_density1(omega, T):
-            r"""Calculates the first spectral density from the angular frequency and
-            temperature.
+        # We assume that system energies are given in units of frequency
+        prefactor = 2 * np.pi * 2 * self.EL
+
+        @_reuse_evaluations
+        def spectral_density(omega, T):
+            r"""Calculates the spectral density shared by the two channels (without
+            the disorder factor) from the angular frequency and temperature.
 
             Parameters
             ----------
@@ -265,52 +350,29 @@ class NoisyCos2PhiQubit(NoisySystem, ABC):
             Spectral density
             """
             therm_ratio = calc_therm_ratio(omega, T)
-            s = (
-                2
-                * self.EL
-                / (1 - self.dL)
+            return (
+                prefactor
                 / q_ind_fun(omega)
                 * (1 / np.tanh(0.5 * np.abs(therm_ratio)))
                 / (1 + np.exp(-therm_ratio))
             )
-            s *= (
-                2 * np.pi
-            )  # We assume that system energies are given in units of frequency
-            return s
-
-        noise_op1 = self.phi_1_operator()
 
-        def spectral_density2(omega, T):
-            r"""Calculates the second spectral density from the angular frequency and
-            temperature.
+        disorder_factor1 = 1 / (1 - self.dL)
+        disorder_factor2 = 1 / (1 + self.dL)
 
-            Parameters
-            ----------
-            omega:
-                angular frequency in system units (units of frequency)
-            T:
-                temperature in Kelvin
+        def spectral_density1(omega, T):
+            return disorder_factor1 * spectral_density(omega, T)
 
-            Returns
-            -------
-            Spectral Density
-            """
-            therm_ratio = calc_therm_ratio(omega, T)
-            s = (
-                2
-                * self.EL
-                / (1 + self.dL)
-                / q_ind_fun(omega)
-                * (1 / np.tanh(0.5 * np.abs(therm_ratio)))
-                / (1 + np.exp(-therm_ratio))
-            )
-            s *= (
-                2 * np.pi
-            )  # We assume that system energies are given in units of frequency
-            return s
+        def spectral_density2(omega, T):
+            return disorder_factor2 * spectral_density(omega, T)
 
+        noise_op1 = self.phi_1_operator()
         noise_op2 = self.phi_2_operator()
 
+        # both channels share the same eigensystem; diagonalize only once
+        if esys is None:
+            esys = self.eigensys(evals_count=max(i, j) + 1)
+
         rate_1 = self.t1(
             i=i,
             j=j,
@@ -380,12 +442,12 @@ class NoisyCos2PhiQubit(NoisySystem, ABC):
             )
 
         if Q_cap is None:
-            # See Smith et al (2020)
+            # See Smith et al (2020); the unit conversion is linear in omega, so the
+            # frequency-independent factor is evaluated once
+            q_cap_6GHz = 1e6 * (2 * np.pi * 6e9 / units.to_standard_units(1.0)) ** 0.7
+
             def q_cap_fun(omega):
-                return (
-                    1e6
-                    * (2 * np.pi * 6e9 / np.abs(units.to_standard_units(omega))) ** 0.7
-                )
+                return q_cap_6GHz * np.abs(omega) ** -0.7
 
         elif callable(Q_cap):  # Q_cap is a function of omega
             q_cap_fun = Q_cap
@@ -394,9 +456,13 @@ class NoisyCos2PhiQubit(NoisySystem, ABC):
             def q_cap_fun(omega):
                 return Q_cap
 
-        def spectral_density1(omega, T):
-            r"""Calculates the first spectral density from the angular frequency and
-            temperature.
+        # We assume that system energies are given in units of frequency
+        prefactor = 2 * np.pi * 2 * 8 * self.ECJ
+
+        @_reuse_evaluations
+        def spectral_density(omega, T):
+            r"""Calculates the spectral density shared by the two channels (without
+            the disorder factor) from the angular frequency and temperature.
 
             Parameters
             ----------
@@ -410,53 +476,29 @@ class NoisyCos2PhiQubit(NoisySystem, ABC):
             Spectral density
             """
             therm_ratio = calc_therm_ratio(omega, T)
-            s1 = (
-                2
-                * 8
-                * self.ECJ
-                / (1 - self.dCJ)
+            return (
+                prefactor
                 / q_cap_fun(omega)
                 * (1 / np.tanh(0.5 * np.abs(therm_ratio)))
                 / (1 + np.exp(-therm_ratio))
             )
-            s1 *= (
-                2 * np.pi
-            )  # We assume that system energies are given in units of frequency
-            return s1
 
-        def spectral_density2(omega, T):
-            r"""Calculates the second spectral density from the angular frequency and
-            temperature.
+        disorder_factor1 = 1 / (1 - self.dCJ)
+        disorder_factor2 = 1 / (1 + self.dCJ)
 
-            Parameters
-            ----------
-            omega:
-                angular frequency in system units (units of frequency)
-            T:
-                temperature in Kelvin
+        def spectral_density1(omega, T):
+            return disorder_factor1 * spectral_density(omega, T)
 
-            Returns
-            -------
-            Spectral density
-            """
-            therm_ratio = calc_therm_ratio(omega, T)
-            s2 = (
-                2
-                * 8
-                * self.ECJ
-                / (1 + self.dCJ)
-                / q_cap_fun(omega)
-                * (1 / np.tanh(0.5 * np.abs(therm_ratio)))
-                / (1 + np.exp(-therm_ratio))
-            )
-            s2 *= (
-                2 * np.pi
-            )  # We assume that system energies are given in units of frequency
-            return s2
+        def spectral_density2(omega, T):
+            return disorder_factor2 * spectral_density(omega, T)
 
         noise_op1 = self.n_1_operator()
         noise_op2 = self.n_2_operator()
 
+        # both channels share the same eigensystem; diagonalize only once
+        if esys is None:
+            esys = self.eigensys(evals_count=max(i, j) + 1)
+
         rate_1 = self.t1(
             i=i,
             j=j,
@@ -525,12 +567,12 @@ class NoisyCos2PhiQubit(NoisySystem, ABC):
             )
 
         if Q_cap is None:
-            # See Smith et al (2020)
+            # See Smith et al (2020); the unit conversion is linear in omega, so the
+            # frequency-independent factor is evaluated once
+            q_cap_6GHz = 1e6 * (2 * np.pi * 6e9 / units.to_standard_units(1.0)) ** 0.7
+
             def q_cap_fun(omega):
-                return (
-                    1e6
-                    * (2 * np.pi * 6e9 / np.abs(units.to_standard_units(omega))) ** 0.7
-                )
+                return q_cap_6GHz * np.abs(omega) ** -0.7
 
         elif callable(Q_cap):  # Q_cap is a function of omega
             q_cap_fun = Q_cap
@@ -539,6 +581,9 @@ class NoisyCos2PhiQubit(NoisySystem, ABC):
             def q_cap_fun(omega):
                 return Q_cap
 
+        # We assume that system energies are given in units of frequency
+        prefactor = 2 * np.pi * 2 * 8 * self.EC
+
         def spectral_density(omega, T):
             r"""Calculates the spectral density from the angular frequency and
             temperature.
@@ -555,18 +600,12 @@ class NoisyCos2PhiQubit(NoisySystem, ABC):
             Spectral density
             """
             therm_ratio = calc_therm_ratio(omega, T)
-            s = (
-                2
-                * 8
-                * self.EC
+            return (
+                prefactor
                 / q_cap_fun(omega)
                 * (1 / np.tanh(0.5 * np.abs(therm_ratio)))
                 / (1 + np.exp(-therm_ratio))
             )
-            s *= (
-                2 * np.pi
-            )  # We assume that system energies are given in units of frequency
-            return s
 
         noise_op = self.n_zeta_operator()
 
@@ -663,6 +702,15 @@ class Cos2PhiQubit(base.QubitBaseClass, serializers.Serializable, NoisyCos2PhiQu
     zeta_cut = descriptors.WatchedProperty(int, "QUANTUMSYSTEM_UPDATE")
     phi_cut = descriptors.WatchedProperty(int, "QUANTUMSYSTEM_UPDATE")
 
+    _SUPPORTED_NOISE_CHANNELS: Tuple[str, ...] = (
+        "tphi_1_over_f_cc",
+        "tphi_1_over_f_flux",
+        "tphi_1_over_f_ng",
+        "t1_capacitive",
+        "t1_inductive",
+        "t1_purcell",
+    )
+
     def __init__(
         self,
         EJ: float,
@@ -692,6 +740,7 @@ class Cos2PhiQubit(base.QubitBaseClass, serializers.Serializable, NoisyCos2PhiQu
             esys_method=esys_method,
             esys_method_options=esys_method_options,
         )
+        self._op_cache: Dict[str, Tuple[Tuple, Any]] = {}
         self.EJ = EJ
         self.ECJ = ECJ
         self.EL = EL
@@ -709,6 +758,22 @@ class Cos2PhiQubit(base.QubitBaseClass, serializers.Serializable, NoisyCos2PhiQu
         self._default_zeta_grid = discretization.Grid1d(-4 * np.pi, 4 * np.pi, 100)
         self._default_theta_grid = discretization.Grid1d(-0.5 * np.pi, 1.5 * np.pi, 100)
 
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, type(self)):
+            return False
+        # cached operators are derived data, exclude them from the comparison
+        self_dict = {k: v for k, v in self.__dict__.items() if k != "_op_cache"}
+        other_dict = {k: v for k, v in other.__dict__.items() if k != "_op_cache"}
+        return self_dict == other_dict
+
+    __hash__ = base.QubitBaseClass.__hash__
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # cached operators are rebuilt on demand and need not be pickled
+        state = self.__dict__.copy()
+        state["_op_cache"] = {}
+        return state
+
     @staticmethod
     def default_params() -> Dict[str, Any]:
         r"""Returns a dictionary of default parameters for the Cos2PhiQubit.
@@ -768,14 +833,7 @@ class Cos2PhiQubit(base.QubitBaseClass, serializers.Serializable, NoisyCos2PhiQu
         -------
         List of strings
         """
-        return [
-            "tphi_1_over_f_cc",
-            "tphi_1_over_f_flux",
-            "tphi_1_over_f_ng",
-            "t1_capacitive",
-            "t1_inductive",
-            "t1_purcell",
-        ]
+        return list(cls._SUPPORTED_NOISE_CHANNELS)
 
     def _dim_phi(self) -> int:
         r"""
@@ -836,7 +894,7 @@ class Cos2PhiQubit(base.QubitBaseClass, serializers.Serializable, NoisyCos2PhiQu
         -------
         Integer
         """
-        return self._dim_phi() * self._dim_zeta() * self._dim_theta()
+        return self.phi_cut * self.zeta_cut * (2 * self.ncut + 1)
 
     def _disordered_el(self) -> float:
         r"""Returns inductive energy renormalized by with disorder.
@@ -926,6 +984,59 @@ class Cos2PhiQubit(base.QubitBaseClass, serializers.Serializable, NoisyCos2PhiQu
         """
         return math.sqrt(16.0 * self.EC * self._disordered_el())
 
+    def _memoized(self, name: str, key: Tuple, builder: Callable[[], Any]) -> Any:
+        r"""Returns the object cached under `name` if it was built for the same `key`,
+        otherwise calls `builder` and caches its result. Keys hold the parameter
+        values the cached object depends on, so stale entries are rebuilt
+        automatically after a parameter change. Cached objects are shared and must
+        be treated as read-only.
+
+        Parameters
+        ----------
+        name:
+            cache entry name
+        key:
+            tuple of parameter values the cached object depends on
+        builder:
+            callable (without arguments) constructing the object
+
+        Returns
+        -------
+        Cached object
+        """
+        cached = self._op_cache.get(name)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        result = builder()
+        self._op_cache[name] = (key, result)
+        return result
+
+    def clear_cache(self) -> None:
+        r"""Empties the cache of operators, Hamiltonian terms and eigensystems. Cached
+        objects are rebuilt on demand, so this only frees memory.
+
+        Parameters
+        ----------
+        self:
+            Method Instance
+        """
+        self._op_cache.clear()
+
+    def _operator_key(self) -> Tuple[int, int, int, float, float]:
+        r"""Returns the parameter values that operators in the harmonic oscillator /
+        charge product basis depend on, for use as a cache key.
+
+        Parameters
+        ----------
+        self:
+            Method Instance
+
+        Returns
+        -------
+        Tuple of cutoffs and oscillator lengths
+        """
+        return (self.phi_cut, self.zeta_cut, self.ncut, self.phi_osc(), self.zeta_osc())
+
     def _phi_operator(self) -> csc_matrix:
         r"""Returns `phi` operator in the harmonic oscillator basis.
 
@@ -939,11 +1050,18 @@ class Cos2PhiQubit(base.QubitBaseClass, serializers.Serializable, NoisyCos2PhiQu
         Compressed Sparse Column Matrix
         """
         dimension = self._dim_phi()
-        return (
-            (op.creation_sparse(dimension) + op.annihilation_sparse(dimension))
-            * self.phi_osc()
-            / math.sqrt(2)
-        )
+        phi_osc = self.phi_osc()
+
+        def build() -> csc_matrix:
+            offdiag = np.sqrt(np.arange(1, dimension)) * phi_osc / math.sqrt(2)
+            return sparse.diags(
+                [offdiag, offdiag],
+                [-1, 1],
+                shape=(dimension, dimension),
+                format="csc",
+            )
+
+        return self._memoized("phi", (dimension, phi_osc), build)
 
     def phi_operator(
         self, energy_esys: Union[bool, Tuple[ndarray, ndarray]] = False
@@ -969,10 +1087,12 @@ class Cos2PhiQubit(base.QubitBaseClass, serializers.Serializable, NoisyCos2PhiQu
             chosen, :math:`\phi` operator has dimensions of m x m, for m given eigenvectors,
             and is returned as an ndarray.
         """
-        native = self._kron3(
-            self._phi_operator(), self._identity_zeta(), self._identity_theta()
+        native = self._memoized(
+            "phi_operator_embedded",
+            self._operator_key(),
+            lambda: self._embed(self._phi_operator(), "phi"),
         )
-        return self.process_op(native_op=native, energy_esys=energy_esys)
+        return self.process_op(native_op=native.copy(), energy_esys=energy_esys)
 
     def _n_phi_operator(self) -> csc_matrix:
         r"""Returns `n_\phi` operator in the harmonic oscillator basis.
@@ -987,16 +1107,22 @@ class Cos2PhiQubit(base.QubitBaseClass, serializers.Serializable, NoisyCos2PhiQu
         Compressed Sparse Column Matrix
         """
         dimension = self._dim_phi()
-        return (
-            1j
-            * (op.creation_sparse(dimension) - op.annihilation_sparse(dimension))
-            / (self.phi_osc() * math.sqrt(2))
-        )
+        phi_osc = self.phi_osc()
+
+        def build() -> csc_matrix:
+            offdiag = 1j * np.sqrt(np.arange(1, dimension)) / (phi_osc * math.sqrt(2))
+            return sparse.diags(
+                [offdiag, -offdiag],
+                [-1, 1],
+                shape=(dimension, dimension),
+                format="csc",
+            )
+
+        return self._memoized("n_phi", (dimension, phi_osc), build)
 
-    # changed expected from csc_matrix to Union[ndarray, coo_matrix]
     def n_phi_operator(
         self, energy_esys: Union[bool, Tuple[ndarray, ndarray]] = False
-    ) -> Union[ndarray, coo_matrix]:
+    ) -> Union[ndarray, csc_matrix]:
         r"""Returns the :math:`n_\phi` operator in the harmonic oscillator or eigenenergy
         basis.
 
@@ -1019,10 +1145,12 @@ class Cos2PhiQubit(base.QubitBaseClass, serializers.Serializable, NoisyCos2PhiQu
             chosen, :math:`n_\phi` operator has dimensions of m x m, for m given eigenvectors,
             and is returned as an ndarray :math:`\zeta`.
         """
-        native = self._kron3(
-            self._n_phi_operator(), self._identity_zeta(), self._identity_theta()
+        native = self._memoized(
+            "n_phi_operator_embedded",
+            self._operator_key(),
+            lambda: self._embed(self._n_phi_operator(), "phi"),
         )
-        return self.process_op(native_op=native, energy_esys=energy_esys)
+        return self.process_op(native_op=native.copy(), energy_esys=energy_esys)
 
     def _zeta_operator(self) -> csc_matrix:
         r"""Returns `zeta` operator in the harmonic oscillator basis.
@@ -1037,11 +1165,18 @@ class Cos2PhiQubit(base.QubitBaseClass, serializers.Serializable, NoisyCos2PhiQu
         Compressed Sparse Column Matrix
         """
         dimension = self._dim_zeta()
-        return (
-            (op.creation_sparse(dimension) + op.annihilation_sparse(dimension))
-            * self.zeta_osc()
-            / math.sqrt(2)
-        )
+        zeta_osc = self.zeta_osc()
+
+        def build() -> csc_matrix:
+            offdiag = np.sqrt(np.arange(1, dimension)) * zeta_osc / math.sqrt(2)
+            return sparse.diags(
+                [offdiag, offdiag],
+                [-1, 1],
+                shape=(dimension, dimension),
+                format="csc",
+            )
+
+        return self._memoized("zeta", (dimension, zeta_osc), build)
 
     def zeta_operator(
         self, energy_esys: Union[bool, Tuple[ndarray, ndarray]] = False
@@ -1068,10 +1203,12 @@ class Cos2PhiQubit(base.QubitBaseClass, serializers.Serializable, NoisyCos2PhiQu
             chosen, :math:`\zeta` operator has dimensions of m x m, for m given eigenvectors,
             and is returned as an ndarray.
         """
-        native = self._kron3(
-            self._identity_phi(), self._zeta_operator(), self._identity_theta()
+        native = self._memoized(
+            "zeta_operator_embedded",
+            self._operator_key(),
+            lambda: self._embed(self._zeta_operator(), "zeta"),
         )
-        return self.process_op(native_op=native, energy_esys=energy_esys)
+        return self.process_op(native_op=native.copy(), energy_esys=energy_esys)
 
     def _n_zeta_operator(self) -> csc_matrix:
         r"""Returns `n_\zeta` operator in the harmonic oscillator basis.
@@ -1086,11 +1223,18 @@ class Cos2PhiQubit(base.QubitBaseClass, serializers.Serializable, NoisyCos2PhiQu
         Compressed Sparse Column Matrix
         """
         dimension = self._dim_zeta()
-        return (
-            1j
-            * (op.creation_sparse(dimension) - op.annihilation_sparse(dimension))
-            / (self.zeta_osc() * math.sqrt(2))
-        )
+        zeta_osc = self.zeta_osc()
+
+        def build() -> csc_matrix:
+            offdiag = 1j * np.sqrt(np.arange(1, dimension)) / (zeta_osc * math.sqrt(2))
+            return sparse.diags(
+                [offdiag, -offdiag],
+                [-1, 1],
+                shape=(dimension, dimension),
+                format="csc",
+            )
+
+        return self._memoized("n_zeta", (dimension, zeta_osc), build)
 
     def n_zeta_operator(
         self, energy_esys: Union[bool, Tuple[ndarray, ndarray]] = False
@@ -1117,10 +1261,57 @@ class Cos2PhiQubit(base.QubitBaseClass, serializers.Serializable, NoisyCos2PhiQu
             eigenenergy basis is chosen, :math:`n_\zeta` operator has dimensions of m x m,
             for m given eigenvectors, and is returned as an ndarray.
         """
-        native = self._kron3(
-            self._identity_phi(), self._n_zeta_operator(), self._identity_theta()
+        native = self._memoized(
+            "n_zeta_operator_embedded",
+            self._operator_key(),
+            lambda: self._embed(self._n_zeta_operator(), "zeta"),
+        )
+        return self.process_op(native_op=native.copy(), energy_esys=energy_esys)
+
+    def _phi_eigensystem(self) -> Tuple[ndarray, ndarray]:
+        r"""Returns eigenvalues and eigenvectors of the (real, tridiagonal) `phi`
+        operator in the harmonic oscillator basis. Functions of `phi` are evaluated
+        from this decomposition. The result is cached and must not be modified.
+
+        Parameters
+        ----------
+        self:
+            Method Instance
+
+        Returns
+        -------
+        Tuple of eigenvalues and eigenvectors (as columns)
+        """
+        dimension = self._dim_phi()
+        phi_osc = self.phi_osc()
+
+        def build() -> Tuple[ndarray, ndarray]:
+            offdiag = np.sqrt(np.arange(1, dimension)) * phi_osc / math.sqrt(2)
+            return sp.linalg.eigh_tridiagonal(np.zeros(dimension), offdiag)
+
+        return self._memoized("phi_eigensystem", (dimension, phi_osc), build)
+
+    def _phi_function_operator(self, name: str, func: Callable) -> csc_matrix:
+        r"""Returns the operator `func(phi)` in the harmonic oscillator basis,
+        cached under `name`.
+
+        Parameters
+        ----------
+        name:
+            cache entry name
+        func:
+            elementwise function applied to the eigenvalues of `phi`
+
+        Returns
+        -------
+        Compressed Sparse Column Matrix
+        """
+        evals, evecs = self._phi_eigensystem()
+        return self._memoized(
+            name,
+            (self._dim_phi(), self.phi_osc()),
+            lambda: csc_matrix((evecs * func(evals)) @ evecs.T),
         )
-        return self.process_op(native_op=native, energy_esys=energy_esys)
 
     def _exp_i_phi_operator(self) -> csc_matrix:
         r"""Returns `e^{i*phi}` operator in the  harmonic oscillator basis.
@@ -1134,8 +1325,7 @@ class Cos2PhiQubit(base.QubitBaseClass, serializers.Serializable, NoisyCos2PhiQu
         -------
         Compressed Sparse Column Matrix
         """
-        exponent = 1j * self._phi_operator()
-        return sp.sparse.linalg.expm(exponent)
+        return self._phi_function_operator("exp_i_phi", lambda w: np.exp(1j * w))
 
     def _cos_phi_operator(self) -> csc_matrix:
         r"""Returns `cos phi` operator in the harmonic oscillator basis.
@@ -1149,9 +1339,7 @@ class Cos2PhiQubit(base.QubitBaseClass, serializers.Serializable, NoisyCos2PhiQu
         -------
         Compressed Sparse Column Matrix
         """
-        cos_phi_op = 0.5 * self._exp_i_phi_operator()
-        cos_phi_op += cos_phi_op.conj().T
-        return cos_phi_op
+        return self._phi_function_operator("cos_phi", np.cos)
 
     def _sin_phi_operator(self) -> csc_matrix:
         r"""Returns `sin phi/2` operator in the LC harmonic oscillator basis.
@@ -1165,9 +1353,29 @@ class Cos2PhiQubit(base.QubitBaseClass, serializers.Serializable, NoisyCos2PhiQu
         -------
         Compressed Sparse Column Matrix
         """
-        sin_phi_op = -1j * 0.5 * self._exp_i_phi_operator()
-        sin_phi_op += sin_phi_op.conj().T
-        return sin_phi_op
+        return self._phi_function_operator("sin_phi", np.sin)
+
+    def _charge_grid(self) -> ndarray:
+        r"""
+        Returns the charge values :math:`-n_\text{cut}, \ldots, n_\text{cut}` of the
+        :math:`\theta` charge basis. The array is cached and read-only.
+
+        Parameters
+        ----------
+        self:
+            Method Instance
+
+        Returns
+        -------
+        ndarray
+        """
+
+        def build():
+            grid = np.arange(-self.ncut, self.ncut + 1, dtype=np.float64)
+            grid.setflags(write=False)
+            return grid
+
+        return self._memoized("charge_grid", (self.ncut,), build)
 
     def _n_theta_operator(self) -> csc_matrix:
         r"""
@@ -1182,10 +1390,11 @@ class Cos2PhiQubit(base.QubitBaseClass, serializers.Serializable, NoisyCos2PhiQu
         -------
         Compressed Sparse Column Matrix
         """
-        diag_elements = np.arange(-self.ncut, self.ncut + 1)
-        return dia_matrix(
-            (diag_elements, [0]), shape=(self._dim_theta(), self._dim_theta())
-        ).tocsc()
+        return self._memoized(
+            "n_theta",
+            (self.ncut,),
+            lambda: sparse.diags(self._charge_grid(), format="csc"),
+        )
 
     def n_theta_operator(
         self, energy_esys: Union[bool, Tuple[ndarray, ndarray]] = False
@@ -1212,10 +1421,15 @@ class Cos2PhiQubit(base.QubitBaseClass, serializers.Serializable, NoisyCos2PhiQu
             eigenenergy basis is chosen, :math:`n_\theta` operator has dimensions of m x m,
             for m given eigenvectors, and is returned as an ndarray.
         """
-        native = self._kron3(
-            self._identity_phi(), self._identity_zeta(), self._n_theta_operator()
+        native = self._memoized(
+            "n_theta_operator_embedded",
+            self._operator_key(),
+            lambda: sparse.diags(
+                np.tile(self._charge_grid(), self._dim_phi() * self._dim_zeta()),
+                format="csc",
+            ),
         )
-        return self.process_op(native_op=native, energy_esys=energy_esys)
+        return self.process_op(native_op=native.copy(), energy_esys=energy_esys)
 
     def _cos_theta_operator(self) -> csc_matrix:
         r"""Returns operator :math:`\cos \theta` in the charge basis.
@@ -1229,21 +1443,13 @@ class Cos2PhiQubit(base.QubitBaseClass, serializers.Serializable, NoisyCos2PhiQu
         -------
         Compressed Sparse Column Matrix
         """
-        cos_op = (
-            0.5
-            * sparse.dia_matrix(
-                (np.ones(self._dim_theta()), [1]),
-                shape=(self._dim_theta(), self._dim_theta()),
-            ).tocsc()
-        )
-        cos_op += (
-            0.5
-            * sparse.dia_matrix(
-                (np.ones(self._dim_theta()), [-1]),
-                shape=(self._dim_theta(), self._dim_theta()),
-            ).tocsc()
-        )
-        return cos_op
+        dimension = self._dim_theta()
+
+        def build() -> csc_matrix:
+            offdiag = np.full(dimension - 1, 0.5)
+            return sparse.diags([offdiag, offdiag], [-1, 1], format="csc")
+
+        return self._memoized("cos_theta", (dimension,), build)
 
     def _sin_theta_operator(self) -> csc_matrix:
         r"""Returns operator :math:`\sin \theta` in the charge basis.
@@ -1257,21 +1463,13 @@ class Cos2PhiQubit(base.QubitBaseClass, serializers.Serializable, NoisyCos2PhiQu
         -------
         Compressed Sparse Column Matrix
         """
-        sin_op = (
-            0.5
-            * sparse.dia_matrix(
-                (np.ones(self._dim_theta()), [-1]),
-                shape=(self._dim_theta(), self._dim_theta()),
-            ).tocsc()
-        )
-        sin_op -= (
-            0.5
-            * sparse.dia_matrix(
-                (np.ones(self._dim_theta()), [1]),
-                shape=(self._dim_theta(), self._dim_theta()),
-            ).tocsc()
-        )
-        return sin_op * (-1j)
+        dimension = self._dim_theta()
+
+        def build() -> csc_matrix:
+            offdiag = np.full(dimension - 1, 0.5j)
+            return sparse.diags([-offdiag, offdiag], [-1, 1], format="csc")
+
+        return self._memoized("sin_theta", (dimension,), build)
 
     def _kron3(self, mat1, mat2, mat3) -> csc_matrix:
         r"""Returns Kronecker product of three matrices.
@@ -1285,7 +1483,57 @@ class Cos2PhiQubit(base.QubitBaseClass, serializers.Serializable, NoisyCos2PhiQu
         -------
         Compressed Sparse Column Matrix
         """
-        return sparse.kron(sparse.kron(mat1, mat2), mat3)
+        return sparse.kron(sparse.kron(mat1, mat2), mat3, format="csc")
+
+    def _embed(self, operator: csc_matrix, subsystem: str) -> csc_matrix:
+        r"""Returns the operator acting on a single degree of freedom, embedded in the
+        full Hilbert space (i.e., the Kronecker product with the identities of the
+        other two subspaces). The CSC arrays of the result are assembled directly
+        from those of `operator`, without intermediate Kronecker products.
+
+        Parameters
+        ----------
+        operator:
+            operator in the basis of the subspace `subsystem`
+        subsystem:
+            one of 'phi', 'zeta', 'theta'
+
+        Returns
+        -------
+        Compressed Sparse Column Matrix
+        """
+        dims = {
+            "phi": (1, self._dim_phi(), self._dim_zeta() * self._dim_theta()),
+            "zeta": (self._dim_phi(), self._dim_zeta(), self._dim_theta()),
+            "theta": (self._dim_phi() * self._dim_zeta(), self._dim_theta(), 1),
+        }
+        if subsystem not in dims:
+            raise ValueError(
+                f"Subsystem must be one of 'phi', 'zeta', 'theta', got {subsystem}"
+            )
+        dim_before, dimension, dim_after = dims[subsystem]
+        operator = csc_matrix(operator)
+
+        # one block of the result is kron(operator, I_after): column (c, k) holds the
+        # entries of column c of `operator`, at rows shifted to (r, k)
+        counts = np.repeat(np.diff(operator.indptr), dim_after)
+        block_nnz = counts.sum()
+        entries = np.repeat(
+            np.repeat(operator.indptr[:-1], dim_after) - (np.cumsum(counts) - counts),
+            counts,
+        ) + np.arange(block_nnz)
+        offsets = np.repeat(np.tile(np.arange(dim_after), dimension), counts)
+        block_indices = operator.indices[entries] * dim_after + offsets
+
+        # the full result repeats that block dim_before times along the diagonal
+        block_size = dimension * dim_after
+        indices = (
+            block_indices + (np.arange(dim_before) * block_size)[:, np.newaxis]
+        ).ravel()
+        data = np.tile(operator.data[entries], dim_before)
+        indptr = np.concatenate(([0], np.cumsum(np.tile(counts, dim_before))))
+        size = dim_before * block_size
+        return csc_matrix((data, indices, indptr), shape=(size, size))
 
     def _identity_phi(self) -> csc_matrix:
         r"""
@@ -1301,8 +1549,7 @@ class Cos2PhiQubit(base.QubitBaseClass, serializers.Serializable, NoisyCos2PhiQu
         -------
         Compressed Sparse Column Matrix
         """
-        dimension = self._dim_phi()
-        return sparse.eye(dimension)
+        return _make_eye(self._dim_phi())
 
     def _identity_zeta(self) -> csc_matrix:
         r"""Returns Identity operator acting only on the :math:`\zeta` Hilbert subspace.
@@ -1316,8 +1563,7 @@ class Cos2PhiQubit(base.QubitBaseClass, serializers.Serializable, NoisyCos2PhiQu
         -------
         Compressed Sparse Column Matrix
         """
-        dimension = self._dim_zeta()
-        return sparse.eye(dimension)
+        return _make_eye(self._dim_zeta())
 
     def _identity_theta(self) -> csc_matrix:
         r"""Returns Identity operator acting only on the :math:`\theta` Hilbert subspace.
@@ -1331,8 +1577,7 @@ class Cos2PhiQubit(base.QubitBaseClass, serializers.Serializable, NoisyCos2PhiQu
         -------
         Compressed Sparse Column Matrix
         """
-        dimension = self._dim_theta()
-        return sparse.eye(dimension)
+        return _make_eye(self._dim_theta())
 
     def total_identity(self) -> csc_matrix:
         r"""Returns Identity operator acting on the total Hilbert space.
@@ -1346,9 +1591,7 @@ class Cos2PhiQubit(base.QubitBaseClass, serializers.Serializable, NoisyCos2PhiQu
         -------
         Compressed Sparse Column Matrix
         """
-        return self._kron3(
-            self._identity_phi(), self._identity_zeta(), self._identity_theta()
-        )
+        return sparse.eye(self.hilbertdim(), format="csc")
 
     def hamiltonian(
         self, energy_esys: Union[bool, Tuple[ndarray, ndarray]] = False
@@ -1378,87 +1621,240 @@ class Cos2PhiQubit(base.QubitBaseClass, serializers.Serializable, NoisyCos2PhiQu
             If in eigenbasis with specific (evals, evecs), dimensions match the
             provided eigenvectors.
         """
-        phi_osc_mat = self._kron3(
-            op.number_sparse(self._dim_phi(), self.phi_plasma()),
-            self._identity_zeta(),
-            self._identity_theta(),
+        native = self._native_hamiltonian()
+        return self.process_hamiltonian(
+            native_hamiltonian=native.copy(), energy_esys=energy_esys
         )
 
-        zeta_osc_mat = self._kron3(
-            self._identity_phi(),
-            op.number_sparse(self._dim_zeta(), self.zeta_plasma()),
-            self._identity_theta(),
+    def _native_hamiltonian(self) -> csc_matrix:
+        r"""Returns the Hamiltonian in the native basis. The matrix is cached for the
+        current parameter values and must not be modified.
+
+        Parameters
+        ----------
+        self:
+            Method Instance
+
+        Returns
+        -------
+        Compressed Sparse Column Matrix
+        """
+        return self._memoized(
+            "hamiltonian", self._hamiltonian_key(), self._build_hamiltonian
         )
 
-        cross_kinetic_mat = (
-            2
-            * self._disordered_ecj()
-            * (
-                self.n_theta_operator()
-                - self.total_identity() * self.ng
-                - self.n_zeta_operator()
-            )
-            ** 2
+    def _hamiltonian_key(self) -> Tuple:
+        r"""Returns the parameter values the Hamiltonian depends on, for use as a
+        cache key.
+
+        Parameters
+        ----------
+        self:
+            Method Instance
+
+        Returns
+        -------
+        Tuple of parameter values
+        """
+        return (
+            self.EJ,
+            self.ECJ,
+            self.EL,
+            self.EC,
+            self.dCJ,
+            self.dL,
+            self.dEJ,
+            self.flux,
+            self.ng,
+            self.ncut,
+            self.zeta_cut,
+            self.phi_cut,
         )
 
-        phi_flux_term = self._cos_phi_operator() * np.cos(
-            self.flux * np.pi
-        ) - self._sin_phi_operator() * np.sin(self.flux * np.pi)
-        junction_mat = (
-            -2
-            * self.EJ
-            * self._kron3(
-                phi_flux_term, self._identity_zeta(), self._cos_theta_operator()
-            )
-            + 2 * self.EJ * self.total_identity()
+    def _shift_invert_operator(self) -> LinearOperator:
+        r"""Returns the inverse of the native Hamiltonian (shift-invert operator for
+        `sigma=0`) as a `LinearOperator`, backed by a sparse LU factorization of the
+        cached Hamiltonian. The factorization is not cached: it is large and only
+        serves the eigensolve it is built for.
+
+        Parameters
+        ----------
+        self:
+            Method Instance
+
+        Returns
+        -------
+        LinearOperator
+        """
+        hamiltonian_mat = self._native_hamiltonian()
+        lu = sparse.linalg.splu(hamiltonian_mat)
+        return LinearOperator(
+            hamiltonian_mat.shape, matvec=lu.solve, dtype=hamiltonian_mat.dtype
         )
 
-        disorder_l = (
-            -2
-            * self._disordered_el()
-            * self.dL
-            * self._kron3(
-                self._phi_operator(), self._zeta_operator(), self._identity_theta()
-            )
+    def _build_hamiltonian(self) -> csc_matrix:
+        r"""Constructs the Hamiltonian in the native basis from the cached
+        parameter-independent terms (see `_static_hamiltonian_terms`), weighted by the
+        current values of `EJ`, `dEJ`, `flux` and `ng`.
+
+        Parameters
+        ----------
+        self:
+            Method Instance
+
+        Returns
+        -------
+        Compressed Sparse Column Matrix
+        """
+        cos_flux = np.cos(np.pi * self.flux)
+        sin_flux = np.sin(np.pi * self.flux)
+        # - cross-kinetic and capacitive disorder terms are quadratic in ng
+        # - cos(phi + pi flux) cos(theta) and sin(phi + pi flux) sin(theta) expanded
+        return self._combine_static_terms(
+            {
+                "kinetic": 1.0,
+                "ng_linear": self.ng,
+                "identity": 2 * self._disordered_ecj() * self.ng**2 + 2 * self.EJ,
+                "cos_phi_cos_theta": -2 * self.EJ * cos_flux,
+                "sin_phi_cos_theta": 2 * self.EJ * sin_flux,
+                "sin_phi_sin_theta": 2 * self.EJ * self.dEJ * cos_flux,
+                "cos_phi_sin_theta": 2 * self.EJ * self.dEJ * sin_flux,
+            }
         )
 
-        dis_phi_flux_term = self._sin_phi_operator() * np.cos(
-            self.flux * np.pi
-        ) + self._cos_phi_operator() * np.sin(self.flux * np.pi)
-        disorder_j = (
-            2
-            * self.EJ
-            * self.dEJ
-            * self._kron3(
-                dis_phi_flux_term, self._identity_zeta(), self._sin_theta_operator()
-            )
+    def _combine_static_terms(self, weights: Dict[str, float]) -> csc_matrix:
+        r"""Returns the weighted sum of the static Hamiltonian terms (see
+        `_static_hamiltonian_terms`). All terms share one sparsity pattern, so the
+        sum only combines their data arrays.
+
+        Parameters
+        ----------
+        weights:
+            prefactors of the terms, by name
+
+        Returns
+        -------
+        Compressed Sparse Column Matrix
+        """
+        terms = self._static_hamiltonian_terms()
+        data = sum(weight * terms[name].data for name, weight in weights.items())
+        pattern = terms["identity"]
+        # eliminate_zeros works in place, the shared pattern arrays must be copied
+        result = csc_matrix(
+            (data, pattern.indices.copy(), pattern.indptr.copy()), shape=pattern.shape
         )
+        result.eliminate_zeros()
+        return result
 
-        dis_c_opt = (
-            self._kron3(
-                self._n_phi_operator(), self._identity_zeta(), self._n_theta_operator()
-            )
-            - self.n_phi_operator() * self.ng
-            - self._kron3(
-                self._n_phi_operator(), self._n_zeta_operator(), self._identity_theta()
+    def _ng_linear_term(self) -> csc_matrix:
+        r"""Returns the Hamiltonian term linear in `ng`, without the factor `ng`:
+        :math:`-4E_{CJ}'(n_\theta - n_\zeta) + 4 dC_J E_{CJ}' n_\phi`. The term is
+        cached and must not be modified.
+
+        Parameters
+        ----------
+        self:
+            Method Instance
+
+        Returns
+        -------
+        Compressed Sparse Column Matrix
+        """
+
+        def build() -> csc_matrix:
+            disordered_ecj = self._disordered_ecj()
+            return (
+                -4 * disordered_ecj * (self.n_theta_operator() - self.n_zeta_operator())
+                + 4 * disordered_ecj * self.dCJ * self.n_phi_operator()
             )
+
+        key = self._operator_key() + (self.ECJ, self.dCJ)
+        return self._memoized("ng_linear", key, build)
+
+    def _static_hamiltonian_terms(self) -> Dict[str, csc_matrix]:
+        r"""Returns the Hamiltonian terms that do not depend on `EJ`, `dEJ`, `flux` and
+        `ng`. The terms are cached, so that sweeps over these parameters only
+        recombine them with new scalar prefactors. The cached matrices must not be
+        modified.
+
+        Parameters
+        ----------
+        self:
+            Method Instance
+
+        Returns
+        -------
+        Dictionary of Compressed Sparse Column Matrices
+        """
+        key = (
+            self.ECJ,
+            self.EL,
+            self.EC,
+            self.dCJ,
+            self.dL,
+            self.ncut,
+            self.zeta_cut,
+            self.phi_cut,
         )
-        disorder_c = -4 * self._disordered_ecj() * self.dCJ * dis_c_opt
-
-        hamiltonian_mat = (
-            phi_osc_mat
-            + zeta_osc_mat
-            + cross_kinetic_mat
-            + junction_mat
-            + disorder_l
-            + disorder_j
-            + disorder_c
+        return self._memoized("static_hamiltonian_terms", key, self._build_static_terms)
+
+    def _build_static_terms(self) -> Dict[str, csc_matrix]:
+        r"""Constructs the terms returned by `_static_hamiltonian_terms`.
+
+        Parameters
+        ----------
+        self:
+            Method Instance
+
+        Returns
+        -------
+        Dictionary of Compressed Sparse Column Matrices
+        """
+        disordered_ecj = self._disordered_ecj()
+        phi_osc_mat = self._embed(
+            op.number_sparse(self._dim_phi(), self.phi_plasma()), "phi"
         )
-        native = hamiltonian_mat.tocsc()
-        return self.process_hamiltonian(
-            native_hamiltonian=native, energy_esys=energy_esys
+
+        zeta_osc_mat = self._embed(
+            op.number_sparse(self._dim_zeta(), self.zeta_plasma()), "zeta"
         )
 
+        # (n_theta - ng - n_zeta)^2 = (n_theta - n_zeta)^2
+        #                             - 2 ng (n_theta - n_zeta) + ng^2
+        charge_diff = self.n_theta_operator() - self.n_zeta_operator()
+        cross_kinetic_mat = 2 * disordered_ecj * charge_diff**2
+
+        # scalar prefactors are applied to the small phi factors before the Kronecker
+        # products, so that the full-size matrices are never rescaled
+        disorder_l = self._kron3(
+            -2 * self._disordered_el() * self.dL * self._phi_operator(),
+            self._zeta_operator(),
+            self._identity_theta(),
+        )
+
+        scaled_n_phi = -4 * disordered_ecj * self.dCJ * self._n_phi_operator()
+        disorder_c = self._kron3(
+            scaled_n_phi, self._identity_zeta(), self._n_theta_operator()
+        ) - self._kron3(scaled_n_phi, self._n_zeta_operator(), self._identity_theta())
+
+        identity_zeta = self._identity_zeta()
+        cos_phi = self._cos_phi_operator()
+        sin_phi = self._sin_phi_operator()
+        cos_theta = self._cos_theta_operator()
+        sin_theta = self._sin_theta_operator()
+        terms = {
+            "kinetic": (
+                phi_osc_mat + zeta_osc_mat + cross_kinetic_mat + disorder_l + disorder_c
+            ),
+            "ng_linear": self._ng_linear_term(),
+            "identity": self.total_identity(),
+            "cos_phi_cos_theta": self._kron3(cos_phi, identity_zeta, cos_theta),
+            "sin_phi_cos_theta": self._kron3(sin_phi, identity_zeta, cos_theta),
+            "cos_phi_sin_theta": self._kron3(cos_phi, identity_zeta, sin_theta),
+            "sin_phi_sin_theta": self._kron3(sin_phi, identity_zeta, sin_theta),
+        }
+        return dict(zip(terms, _on_common_pattern(list(terms.values()))))
+
     def _evals_calc(self, evals_count) -> ndarray:
         r"""Evaluvates the hamiltonian, and returns the safe eigensvalues.
 
@@ -1473,18 +1869,21 @@ class Cos2PhiQubit(base.QubitBaseClass, serializers.Serializable, NoisyCos2PhiQu
         -------
         Sorted list of eigenvalues
         """
-        hamiltonian_mat = self.hamiltonian()
+        hamiltonian_mat = self._native_hamiltonian()
         evals = utils.eigsh_safe(
             hamiltonian_mat,
             k=evals_count,
             return_eigenvectors=False,
             sigma=0.0,
             which="LM",
+            OPinv=self._shift_invert_operator(),
         )
         return np.sort(evals)
 
     def _esys_calc(self, evals_count) -> Tuple[ndarray, ndarray]:
         r"""Evaluvates the Hamiltonian and returns the eigenvalues and eigenvectors.
+        The eigensystem is cached, so that consecutive operators requested in the
+        energy eigenbasis (`energy_esys=True`) share one diagonalization.
 
         Parameters
         ----------
@@ -1497,16 +1896,21 @@ class Cos2PhiQubit(base.QubitBaseClass, serializers.Serializable, NoisyCos2PhiQu
         -------
         Eigenvalues, Eigenvectors
         """
-        hamiltonian_mat = self.hamiltonian()
-        evals, evecs = utils.eigsh_safe(
-            hamiltonian_mat,
-            k=evals_count,
-            return_eigenvectors=True,
-            sigma=0.0,
-            which="LM",
-        )
-        evals, evecs = utils.order_eigensystem(evals, evecs)
-        return evals, evecs
+
+        def build() -> Tuple[ndarray, ndarray]:
+            evals, evecs = utils.eigsh_safe(
+                self._native_hamiltonian(),
+                k=evals_count,
+                return_eigenvectors=True,
+                sigma=0.0,
+                which="LM",
+                OPinv=self._shift_invert_operator(),
+            )
+            return utils.order_eigensystem(evals, evecs)
+
+        key = self._hamiltonian_key() + (evals_count,)
+        evals, evecs = self._memoized("esys", key, build)
+        return evals.copy(), evecs.copy()
 
     def potential(self, phi, zeta, theta) -> float:
         r"""Evaluates the potential energy function at given coordinate values.
@@ -1534,9 +1938,10 @@ class Cos2PhiQubit(base.QubitBaseClass, serializers.Serializable, NoisyCos2PhiQu
         Union[float, ndarray]
             The potential energy at the specified coordinates
         """
+        disordered_el = self._disordered_el()
         return (
-            self._disordered_el() * (phi * phi)
-            + self._disordered_el() * (zeta * zeta)
+            disordered_el * (phi * phi)
+            + disordered_el * (zeta * zeta)
             - 2 * self.EJ * np.cos(theta) * np.cos(phi + np.pi * self.flux)
             + 2 * self.dEJ * self.EJ * np.sin(phi + np.pi * self.flux) * np.sin(theta)
         )
@@ -1641,32 +2046,26 @@ class Cos2PhiQubit(base.QubitBaseClass, serializers.Serializable, NoisyCos2PhiQu
         wavefunc_basis_amplitudes = evecs[:, which].reshape(
             self._dim_phi(), self._dim_zeta(), self._dim_theta()
         )
-        wavefunc_amplitudes = np.zeros(
-            (phi_grid.pt_count, zeta_grid.pt_count, theta_grid.pt_count),
-            dtype=np.complex128,
+        phi_osc = self.phi_osc()
+        zeta_osc = self.zeta_osc()
+        phi_wavefunc_amplitudes = osc.harm_osc_wavefunctions(
+            self._dim_phi(), phi_basis_labels, phi_osc
+        )
+        zeta_wavefunc_amplitudes = osc.harm_osc_wavefunctions(
+            self._dim_zeta(), zeta_basis_labels, zeta_osc
         )
-        for i in range(self._dim_phi()):
-            for j in range(self._dim_zeta()):
-                for k in range(self._dim_theta()):
-                    n_phi, n_zeta, n_theta = i, j, k - self.ncut
-                    phi_wavefunc_amplitudes = osc.harm_osc_wavefunction(
-                        n_phi, phi_basis_labels, self.phi_osc()
-                    )
-                    zeta_wavefunc_amplitudes = osc.harm_osc_wavefunction(
-                        n_zeta, zeta_basis_labels, self.zeta_osc()
-                    )
-                    theta_wavefunc_amplitudes = (
-                        np.exp(-1j * n_theta * theta_basis_labels) / (2 * np.pi) ** 0.5
-                    )
-                    wavefunc_amplitudes += wavefunc_basis_amplitudes[
-                        i, j, k
-                    ] * np.tensordot(
-                        np.tensordot(
-                            phi_wavefunc_amplitudes, zeta_wavefunc_amplitudes, 0
-                        ),
-                        theta_wavefunc_amplitudes,
-                        0,
-                    )
+        theta_wavefunc_amplitudes = (
+            np.exp(-1j * np.outer(self._charge_grid(), theta_basis_labels))
+            / (2 * np.pi) ** 0.5
+        )
+        wavefunc_amplitudes = np.einsum(
+            "ijk,ip,jz,kt->pzt",
+            wavefunc_basis_amplitudes,
+            phi_wavefunc_amplitudes,
+            zeta_wavefunc_amplitudes,
+            theta_wavefunc_amplitudes,
+            optimize=True,
+        ).astype(np.complex128, copy=False)
 
         grid3d = discretization.GridSpec(
             np.asarray(
@@ -1776,8 +2175,12 @@ class Cos2PhiQubit(base.QubitBaseClass, serializers.Serializable, NoisyCos2PhiQu
             basis is chosen, operator has dimensions of m x m, for m given eigenvectors,
             and is returned as an ndarray.
         """
-        native = self.zeta_operator() - self.phi_operator()
-        return self.process_op(native_op=native, energy_esys=energy_esys)
+        native = self._memoized(
+            "phi_1",
+            self._operator_key(),
+            lambda: self.zeta_operator() - self.phi_operator(),
+        )
+        return self.process_op(native_op=native.copy(), energy_esys=energy_esys)
 
     def phi_2_operator(
         self, energy_esys: Union[bool, Tuple[ndarray, ndarray]] = False
@@ -1804,8 +2207,12 @@ class Cos2PhiQubit(base.QubitBaseClass, serializers.Serializable, NoisyCos2PhiQu
             basis is chosen, operator has dimensions of m x m, for m given eigenvectors,
             and is returned as an ndarray.
         """
-        native = -self.zeta_operator() - self.phi_operator()
-        return self.process_op(native_op=native, energy_esys=energy_esys)
+        native = self._memoized(
+            "phi_2",
+            self._operator_key(),
+            lambda: -self.zeta_operator() - self.phi_operator(),
+        )
+        return self.process_op(native_op=native.copy(), energy_esys=energy_esys)
 
     def n_1_operator(
         self, energy_esys: Union[bool, Tuple[ndarray, ndarray]] = False
@@ -1832,10 +2239,13 @@ class Cos2PhiQubit(base.QubitBaseClass, serializers.Serializable, NoisyCos2PhiQu
             basis is chosen, operator has dimensions of m x m, for m given eigenvectors,
             and is returned as an ndarray.
         """
-        native = 0.5 * self.n_phi_operator() + 0.5 * (
-            self.n_theta_operator() - self.n_zeta_operator()
+        native = self._memoized(
+            "n_1",
+            self._operator_key(),
+            lambda: 0.5 * self.n_phi_operator()
+            + 0.5 * (self.n_theta_operator() - self.n_zeta_operator()),
         )
-        return self.process_op(native_op=native, energy_esys=energy_esys)
+        return self.process_op(native_op=native.copy(), energy_esys=energy_esys)
 
     def n_2_operator(
         self, energy_esys: Union[bool, Tuple[ndarray, ndarray]] = False
@@ -1862,10 +2272,13 @@ class Cos2PhiQubit(base.QubitBaseClass, serializers.Serializable, NoisyCos2PhiQu
             basis is chosen, operator has dimensions of m x m, for m given eigenvectors,
             and is returned as an ndarray.
         """
-        native = 0.5 * self.n_phi_operator() - 0.5 * (
-            self.n_theta_operator() - self.n_zeta_operator()
+        native = self._memoized(
+            "n_2",
+            self._operator_key(),
+            lambda: 0.5 * self.n_phi_operator()
+            - 0.5 * (self.n_theta_operator() - self.n_zeta_operator()),
         )
-        return self.process_op(native_op=native, energy_esys=energy_esys)
+        return self.process_op(native_op=native.copy(), energy_esys=energy_esys)
 
     def d_hamiltonian_d_flux(
         self, energy_esys: Union[bool, Tuple[ndarray, ndarray]] = False
@@ -1890,31 +2303,19 @@ class Cos2PhiQubit(base.QubitBaseClass, serializers.Serializable, NoisyCos2PhiQu
         Union[ndarray, csc_matrix]
             The flux derivative operator ∂H/∂(flux·π) in the specified basis
         """
-        phi_flux_term = self._sin_phi_operator() * np.cos(
-            self.flux * np.pi
-        ) + self._cos_phi_operator() * np.sin(self.flux * np.pi)
-        junction_mat = (
-            2
-            * self.EJ
-            * self._kron3(
-                phi_flux_term, self._identity_zeta(), self._cos_theta_operator()
-            )
-            * np.pi
+        # the flux-independent Kronecker products are shared with the Hamiltonian;
+        # sin(phi + pi flux) cos(theta) and cos(phi + pi flux) sin(theta), expanded
+        cos_flux = np.cos(np.pi * self.flux)
+        sin_flux = np.sin(np.pi * self.flux)
+        prefactor = 2 * np.pi * self.EJ
+        native = self._combine_static_terms(
+            {
+                "sin_phi_cos_theta": prefactor * cos_flux,
+                "cos_phi_cos_theta": prefactor * sin_flux,
+                "cos_phi_sin_theta": prefactor * self.dEJ * cos_flux,
+                "sin_phi_sin_theta": -prefactor * self.dEJ * sin_flux,
+            }
         )
-
-        dis_phi_flux_term = self._cos_phi_operator() * np.cos(
-            self.flux * np.pi
-        ) - self._sin_phi_operator() * np.sin(self.flux * np.pi)
-        dis_junction_mat = (
-            2
-            * self.dEJ
-            * self.EJ
-            * self._kron3(
-                dis_phi_flux_term, self._identity_zeta(), self._sin_theta_operator()
-            )
-            * np.pi
-        )
-        native = junction_mat + dis_junction_mat
         return self.process_op(native_op=native, energy_esys=energy_esys)
 
     def d_hamiltonian_d_EJ(
@@ -1942,24 +2343,17 @@ class Cos2PhiQubit(base.QubitBaseClass, serializers.Serializable, NoisyCos2PhiQu
             basis is chosen, operator has dimensions of m x m, for m given eigenvectors,
             and is returned as an ndarray.
         """
-        phi_flux_term = self._cos_phi_operator() * np.cos(
-            self.flux * np.pi
-        ) - self._sin_phi_operator() * np.sin(self.flux * np.pi)
-        junction_mat = -2 * self._kron3(
-            phi_flux_term, self._identity_zeta(), self._cos_theta_operator()
-        )
-
-        dis_phi_flux_term = self._sin_phi_operator() * np.cos(
-            self.flux * np.pi
-        ) + self._cos_phi_operator() * np.sin(self.flux * np.pi)
-        dis_junction_mat = (
-            2
-            * self.dEJ
-            * self._kron3(
-                dis_phi_flux_term, self._identity_zeta(), self._sin_theta_operator()
-            )
+        # cos(phi + pi flux) cos(theta) and sin(phi + pi flux) sin(theta), expanded
+        cos_flux = np.cos(np.pi * self.flux)
+        sin_flux = np.sin(np.pi * self.flux)
+        native = self._combine_static_terms(
+            {
+                "cos_phi_cos_theta": -2 * cos_flux,
+                "sin_phi_cos_theta": 2 * sin_flux,
+                "sin_phi_sin_theta": 2 * self.dEJ * cos_flux,
+                "cos_phi_sin_theta": 2 * self.dEJ * sin_flux,
+            }
         )
-        native = junction_mat + dis_junction_mat
         return self.process_op(native_op=native, energy_esys=energy_esys)
 
     def d_hamiltonian_d_ng(
@@ -1990,9 +2384,7 @@ class Cos2PhiQubit(base.QubitBaseClass, serializers.Serializable, NoisyCos2PhiQu
             truncated_dim or the provided eigenvectors.
         """
         native = (
-            4 * self.dCJ * self._disordered_ecj() * self.n_phi_operator()
-            - 4
-            * self._disordered_ecj()
-            * (self.n_theta_operator() - self.ng - self.n_zeta_operator())
+            self._ng_linear_term()
+            + 4 * self._disordered_ecj() * self.ng * self.total_identity()
         )
         return self.process_op(native_op=native, energy_esys=energy_esys)
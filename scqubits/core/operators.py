@@ -10,7 +10,9 @@
 #    LICENSE file in the root directory of this source tree.
 ############################################################################
 
-from typing import Optional, Union
+import functools
+
+from typing import Callable, List, Optional, Tuple, Union
 
 import numpy as np
 import scipy as sp
@@ -18,21 +20,57 @@ import scipy as sp
 from numpy import ndarray
 from scipy.sparse import csc_matrix
 
+_CACHED_OPERATOR_BUILDERS: List[Callable] = []
+
+
+def _cached_sparse_operator(
+    func: Callable[..., csc_matrix],
+) -> Callable[..., csc_matrix]:
+    """Decorator memoizing a sparse operator builder on its arguments. Callers receive
+    a copy of the memoized matrix, so that modifying the result is safe. Calls with
+    unhashable arguments (e.g., a prefactor given as numpy array) bypass the cache."""
+    cached_func = functools.lru_cache(maxsize=128, typed=True)(func)
+    _CACHED_OPERATOR_BUILDERS.append(cached_func)
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs) -> csc_matrix:
+        try:
+            hash((args, tuple(kwargs.items())))
+        except TypeError:
+            return func(*args, **kwargs)
+        return cached_func(*args, **kwargs).copy()
+
+    wrapper.cache_info = cached_func.cache_info  # type: ignore
+    wrapper.cache_clear = cached_func.cache_clear  # type: ignore
+    return wrapper
+
+
+def clear_operator_caches() -> None:
+    """Empties the caches of the memoized operator builders."""
+    for cached_func in _CACHED_OPERATOR_BUILDERS:
+        cached_func.cache_clear()
+    _a_plus_adag_eigensystem.cache_clear()
+
 
 def annihilation(dimension: int) -> ndarray:
     """Returns a dense matrix of size dimension x dimension representing the
     annihilation operator in number basis."""
-    offdiag_elements = np.sqrt(range(1, dimension))
-    return np.diagflat(offdiag_elements, 1)
+    matrix = np.zeros((dimension, dimension))
+    matrix.reshape(-1)[1 :: dimension + 1] = np.sqrt(
+        np.arange(1, dimension, dtype=np.float64)
+    )
+    return matrix
 
 
+@_cached_sparse_operator
 def annihilation_sparse(dimension: int) -> csc_matrix:
     """Returns a matrix of size dimension x dimension representing the annihilation
     operator in the format of a scipy sparse.csc_matrix."""
-    offdiag_elements = np.sqrt(range(dimension))
-    return sp.sparse.dia_matrix(
-        (offdiag_elements, [1]), shape=(dimension, dimension)
-    ).tocsc()
+    # column j > 0 holds sqrt(j) in row j - 1
+    offdiag_elements = np.sqrt(np.arange(1, dimension, dtype=np.float64))
+    indices = np.arange(dimension - 1, dtype=np.int32)
+    indptr = np.concatenate(([0], np.arange(dimension, dtype=np.int32)))
+    return csc_matrix((offdiag_elements, indices, indptr), shape=(dimension, dimension))
 
 
 def creation(dimension: int) -> ndarray:
@@ -41,6 +79,7 @@ def creation(dimension: int) -> ndarray:
     return annihilation(dimension).T
 
 
+@_cached_sparse_operator
 def creation_sparse(dimension: int) -> csc_matrix:
     """Returns a matrix of size dimension x dimension representing the creation operator
     in the format of a scipy sparse.csc_matrix."""
@@ -61,9 +100,17 @@ def hubbard_sparse(j1: int, j2: int, dimension: int) -> csc_matrix:
     -------
         sparse number operator matrix, size dimension x dimension
     """
-    hubbardmat = sp.sparse.dok_matrix((dimension, dimension), dtype=np.float64)
-    hubbardmat[j1, j2] = 1.0
-    return hubbardmat.asformat("csc")
+    for index in (j1, j2):
+        if not -dimension <= index < dimension:
+            raise IndexError(f"index ({index}) out of range")
+    # negative indices count from the end, as in numpy indexing
+    j1, j2 = j1 % dimension, j2 % dimension
+    indptr = np.zeros(dimension + 1, dtype=np.int32)
+    indptr[j2 + 1 :] = 1
+    return csc_matrix(
+        (np.ones(1), np.array([j1], dtype=np.int32), indptr),
+        shape=(dimension, dimension),
+    )
 
 
 def number(
@@ -88,9 +135,12 @@ def number(
     diag_elements = np.arange(dimension, dtype=np.float64)
     if prefactor:
         diag_elements *= prefactor
-    return np.diagflat(diag_elements)
+    matrix = np.zeros((dimension, dimension))
+    np.fill_diagonal(matrix, diag_elements)
+    return matrix
 
 
+@_cached_sparse_operator
 def number_sparse(
     dimension: int, prefactor: Optional[Union[float, complex]] = None
 ) -> csc_matrix:
@@ -111,12 +161,16 @@ def number_sparse(
     """
     diag_elements = np.arange(dimension, dtype=np.float64)
     if prefactor:
-        diag_elements *= prefactor
-    return sp.sparse.dia_matrix(
-        (diag_elements, [0]), shape=(dimension, dimension), dtype=np.float64
-    ).tocsc()
+        diag_elements = diag_elements * prefactor
+    # the vanishing (0, 0) entry is not stored
+    indices = np.arange(1, dimension, dtype=np.int32)
+    indptr = np.concatenate(([0], np.arange(dimension, dtype=np.int32)))
+    return csc_matrix(
+        (diag_elements[1:], indices, indptr), shape=(dimension, dimension)
+    )
 
 
+@_cached_sparse_operator
 def a_plus_adag_sparse(
     dimension: int, prefactor: Union[float, complex, None] = None
 ) -> csc_matrix:
@@ -157,7 +211,38 @@ def a_plus_adag(
     -------
         prefactor * (:math:`a+a^\dagger`) as ndarray, size dimension x dimension
     """
-    return a_plus_adag_sparse(dimension, prefactor=prefactor).toarray()
+    prefactor = prefactor if prefactor is not None else 1.0
+    offdiag_elements = prefactor * np.sqrt(np.arange(1, dimension, dtype=np.float64))
+    matrix = np.zeros((dimension, dimension), dtype=offdiag_elements.dtype)
+    indices = np.arange(dimension - 1)
+    matrix[indices, indices + 1] = offdiag_elements
+    matrix[indices + 1, indices] = offdiag_elements
+    return matrix
+
+
+@functools.lru_cache(maxsize=32)
+def _a_plus_adag_eigensystem(dimension: int) -> Tuple[ndarray, ndarray]:
+    r"""Returns the eigenvalues and eigenvectors of :math:`a+a^\dagger`. The arrays
+    are shared between all callers and are read-only."""
+    evals, evecs = sp.linalg.eigh_tridiagonal(
+        np.zeros(dimension), np.sqrt(np.arange(1, dimension, dtype=np.float64))
+    )
+    evals.setflags(write=False)
+    evecs.setflags(write=False)
+    return evals, evecs
+
+
+def _a_plus_adag_function(
+    dimension: int,
+    prefactor: Union[float, complex, None],
+    func: Callable[[ndarray], ndarray],
+) -> ndarray:
+    r"""Returns func(prefactor(:math:`a+a^\dagger`)) as ndarray. The real symmetric
+    tridiagonal matrix :math:`a+a^\dagger` is diagonalized once, so that the matrix
+    function reduces to applying func to its eigenvalues."""
+    prefactor = prefactor if prefactor is not None else 1.0
+    evals, evecs = _a_plus_adag_eigensystem(dimension)
+    return (evecs * func(prefactor * evals)) @ evecs.T
 
 
 def cos_theta_harmonic(
@@ -178,7 +263,7 @@ def cos_theta_harmonic(
     -------
         prefactor * (:math:`a+a^\dagger`) as ndarray, size dimension x dimension
     """
-    return sp.linalg.cosm(a_plus_adag_sparse(dimension, prefactor=prefactor).toarray())
+    return _a_plus_adag_function(dimension, prefactor, np.cos)
 
 
 def sin_theta_harmonic(
@@ -199,9 +284,10 @@ def sin_theta_harmonic(
     -------
         prefactor * (:math:`a+a^\dagger`) as ndarray, size dimension x dimension
     """
-    return sp.linalg.sinm(a_plus_adag_sparse(dimension, prefactor=prefactor).toarray())
+    return _a_plus_adag_function(dimension, prefactor, np.sin)
 
 
+@_cached_sparse_operator
 def iadag_minus_ia_sparse(
     dimension: int, prefactor: Union[float, complex, None] = None
 ) -> csc_matrix:
@@ -221,8 +307,15 @@ def iadag_minus_ia_sparse(
         prefactor * (:math:`ia-ia^\dagger`) as sparse operator matrix, size dimension x dimension
     """
     prefactor = prefactor if prefactor is not None else 1.0
-    return prefactor * (
-        1j * creation_sparse(dimension) - 1j * annihilation_sparse(dimension)
+    offdiag_elements = 1j * prefactor * np.sqrt(np.arange(dimension, dtype=np.float64))
+    # column j holds -i prefactor sqrt(j) in row j - 1 and i prefactor sqrt(j + 1) in
+    # row j + 1, where these rows exist
+    rows = np.arange(dimension)[:, np.newaxis] + np.array([-1, 1])
+    values = np.stack((-offdiag_elements, np.append(offdiag_elements[1:], 0.0)), axis=1)
+    stored = (rows >= 0) & (rows < dimension)
+    indptr = np.concatenate(([0], np.cumsum(stored.sum(axis=1))))
+    return csc_matrix(
+        (values[stored], rows[stored], indptr), shape=(dimension, dimension)
     )
 
 
@@ -247,21 +340,29 @@ def iadag_minus_ia(
     return iadag_minus_ia_sparse(dimension, prefactor=prefactor).toarray()
 
 
+_SIGMA_PLUS = np.asarray([[0.0, 1.0], [0.0, 0.0]])
+_SIGMA_X = np.asarray([[0.0, 1.0], [1.0, 0.0]])
+_SIGMA_Y = np.asarray([[0.0, -1j], [1j, 0.0]])
+_SIGMA_Z = np.asarray([[1.0, 0.0], [0.0, -1.0]])
+for _sigma in (_SIGMA_PLUS, _SIGMA_X, _SIGMA_Y, _SIGMA_Z):
+    _sigma.setflags(write=False)
+
+
 def sigma_minus() -> np.ndarray:
-    return sigma_plus().T
+    return _SIGMA_PLUS.T.copy()
 
 
 def sigma_plus() -> np.ndarray:
-    return np.asarray([[0.0, 1.0], [0.0, 0.0]])
+    return _SIGMA_PLUS.copy()
 
 
 def sigma_x() -> np.ndarray:
-    return np.asarray([[0.0, 1.0], [1.0, 0.0]])
+    return _SIGMA_X.copy()
 
 
 def sigma_y() -> np.ndarray:
-    return np.asarray([[0.0, -1j], [1j, 0.0]])
+    return _SIGMA_Y.copy()
 
 
 def sigma_z() -> np.ndarray:
-    return np.asarray([[1.0, 0.0], [0.0, -1.0]])
+    return _SIGMA_Z.copy()
@@ -57,6 +57,43 @@ def harm_osc_wavefunction(
     return result[0]
 
 
+def harm_osc_wavefunctions(n_max: int, x: ndarray, l_osc: float) -> ndarray:
+    r"""Return the harmonic oscillator wave functions :math:`\psi_n(x)` for all quantum
+    numbers :math:`n=0,1,\ldots,n_\text{max}-1`, see `harm_osc_wavefunction`.
+
+    The wave functions are generated together by the three-term recurrence
+    :math:`\psi_{n+1} = \sqrt{2/(n+1)}\,(x/l_{\rm osc})\,\psi_n
+    - \sqrt{n/(n+1)}\,\psi_{n-1}`, avoiding one special-function evaluation per
+    quantum number.
+
+    Parameters
+    ----------
+    n_max:
+        number of wave functions
+    x:
+        coordinates where wave functions are evaluated
+    l_osc:
+        oscillator length, defined via <0|x^2|0> = l_osc^2/2
+
+    Returns
+    -------
+        array of shape (n_max, len(x)); row n holds the values of :math:`\psi_n`
+    """
+    xi = np.asarray(x, dtype=np.float64) / l_osc
+    result = np.empty((n_max,) + xi.shape)
+    if n_max == 0:
+        return result
+    result[0] = np.exp(-0.5 * xi**2) / np.sqrt(l_osc * np.sqrt(np.pi))
+    if n_max > 1:
+        result[1] = np.sqrt(2.0) * xi * result[0]
+    for n in range(1, n_max - 1):
+        result[n + 1] = (
+            np.sqrt(2.0 / (n + 1)) * xi * result[n]
+            - np.sqrt(n / (n + 1)) * result[n - 1]
+        )
+    return result
+
+
 def convert_to_E_osc(E_kin: float, E_pot: float) -> float:
     r"""Returns the oscillator energy given a harmonic Hamiltonian of the form
     :math:`H=\frac{1}{2}E_{\rm kin}p^2 + \frac{1}{2}E_{\rm pot}x^2`"""
@@ -30,3 +30,68 @@ class TestCos2PhiQubit(StandardTests):
         cls.op2_str = "zeta_operator"
         cls.param_name = "flux"
         cls.param_list = np.linspace(0, 0.5, 5)
+
+    def test_phi_operator_cache(self):
+        qbt = Cos2PhiQubit(**Cos2PhiQubit.default_params())
+        phi_op = qbt._phi_operator()
+        assert qbt._phi_operator() is phi_op
+        qbt.EL = 2.0
+        updated_phi_op = qbt._phi_operator()
+        assert updated_phi_op is not phi_op
+        assert not np.allclose(updated_phi_op.toarray(), phi_op.toarray())
+
+    def test_embed_matches_kron(self):
+        qbt = Cos2PhiQubit(**Cos2PhiQubit.default_params())
+        qbt.phi_cut, qbt.zeta_cut, qbt.ncut = 4, 5, 3
+        identities = [qbt._identity_phi(), qbt._identity_zeta(), qbt._identity_theta()]
+        operators = {
+            "phi": qbt._n_phi_operator(),
+            "zeta": qbt._zeta_operator(),
+            "theta": qbt._sin_theta_operator(),
+        }
+        for position, (subsystem, operator) in enumerate(operators.items()):
+            factors = list(identities)
+            factors[position] = operator
+            expected = qbt._kron3(*factors)
+            assert np.allclose(
+                qbt._embed(operator, subsystem).toarray(), expected.toarray()
+            )
+
+    def test_hamiltonian_after_parameter_change(self):
+        params = Cos2PhiQubit.default_params()
+        qbt = Cos2PhiQubit(**params)
+        qbt.hamiltonian()
+        params.update(flux=0.3, ng=0.2, dEJ=0.1)
+        qbt.flux, qbt.ng, qbt.dEJ = params["flux"], params["ng"], params["dEJ"]
+        expected = Cos2PhiQubit(**params).hamiltonian()
+        assert np.allclose(qbt.hamiltonian().toarray(), expected.toarray())
+
+    def test_d_hamiltonian_d_ng_at_finite_ng(self):
+        params = Cos2PhiQubit.default_params()
+        params["ng"] = 0.3
+        qbt = Cos2PhiQubit(**params)
+        step = 1e-6
+        hamiltonian = qbt.hamiltonian()
+        qbt.ng += step
+        finite_difference = (qbt.hamiltonian() - hamiltonian) / step
+        qbt.ng -= step
+        assert np.allclose(
+            qbt.d_hamiltonian_d_ng().toarray(), finite_difference.toarray(), atol=1e-4
+        )
+
+    def test_eigensys_cache(self):
+        qbt = Cos2PhiQubit(**Cos2PhiQubit.default_params())
+        evals, evecs = qbt.eigensys()
+        evecs[:] = 0.0
+        assert np.allclose(qbt.eigensys()[0], evals)
+        assert np.any(qbt.eigensys()[1])
+        qbt.flux = 0.2
+        assert not np.allclose(qbt.eigensys()[0], evals)
+
+    def test_clear_cache(self):
+        qbt = Cos2PhiQubit(**Cos2PhiQubit.default_params())
+        evals = qbt.eigenvals()
+        assert "shift_invert" not in qbt._op_cache
+        qbt.clear_cache()
+        assert not qbt._op_cache
+        assert np.allclose(qbt.eigenvals(), evals)
@@ -0,0 +1,118 @@
+# test_operators.py
+# meant to be run with 'pytest'
+#
+# This file is part of scqubits: a Python package for superconducting qubits,
+# Quantum 5, 583 (2021). https://quantum-journal.org/papers/q-2021-11-17-583/
+#
+#    Copyright (c) 2019 and later, Jens Koch and Peter Groszkowski
+#    All rights reserved.
+#
+#    This source code is licensed under the BSD-style license found in the
+#    LICENSE file in the root directory of this source tree.
+############################################################################
+
+import numpy as np
+import pytest
+import scipy as sp
+
+import scqubits.core.operators as op
+
+
+def assert_same_sparse(matrix, expected):
+    assert matrix.format == "csc"
+    assert matrix.shape == expected.shape
+    assert matrix.dtype == expected.dtype
+    assert matrix.nnz == expected.nnz
+    assert matrix.has_canonical_format
+    assert np.array_equal(matrix.toarray(), expected.toarray())
+
+
+class TestOperators:
+    @pytest.mark.parametrize("j1, j2", [(0, 0), (1, 4), (5, 2), (-1, -1), (-6, 3)])
+    def test_hubbard_sparse(self, j1, j2):
+        expected = sp.sparse.dok_matrix((6, 6), dtype=np.float64)
+        expected[j1, j2] = 1.0
+        assert_same_sparse(op.hubbard_sparse(j1, j2, 6), expected.asformat("csc"))
+
+    @pytest.mark.parametrize("j1, j2", [(1, 7), (6, 0), (0, 6), (-7, 0), (0, -7)])
+    def test_hubbard_sparse_out_of_range(self, j1, j2):
+        expected = sp.sparse.dok_matrix((6, 6), dtype=np.float64)
+        with pytest.raises(IndexError):
+            expected[j1, j2] = 1.0
+        with pytest.raises(IndexError):
+            op.hubbard_sparse(j1, j2, 6)
+
+    def test_cached_operators_are_copies(self):
+        first = op.a_plus_adag_sparse(5, 0.5)
+        first.data[:] = 7.0
+        second = op.a_plus_adag_sparse(5, 0.5)
+        assert second is not first
+        assert np.array_equal(
+            second.toarray(), 0.5 * (op.annihilation(5) + op.creation(5))
+        )
+
+    def test_cached_operators_keep_prefactor_type(self):
+        assert op.a_plus_adag_sparse(5, 0.5).dtype == np.float64
+        assert op.a_plus_adag_sparse(5, 0.5 + 0j).dtype == np.complex128
+        assert op.a_plus_adag_sparse(5, 0.5).dtype == np.float64
+
+    def test_clear_operator_caches(self):
+        op.annihilation_sparse(4)
+        op.creation_sparse(4)
+        op.number_sparse(4, 2.0)
+        op.a_plus_adag_sparse(4, 0.5)
+        op.iadag_minus_ia_sparse(4, 0.5)
+        op.cos_theta_harmonic(4, 0.5)
+        caches = [
+            op.annihilation_sparse,
+            op.creation_sparse,
+            op.number_sparse,
+            op.a_plus_adag_sparse,
+            op.iadag_minus_ia_sparse,
+            op._a_plus_adag_eigensystem,
+        ]
+        assert all(cache.cache_info().currsize > 0 for cache in caches)
+        op.clear_operator_caches()
+        assert all(cache.cache_info().currsize == 0 for cache in caches)
+
+    def test_cached_operators_accept_array_prefactor(self):
+        matrix = op.a_plus_adag_sparse(4, np.array(0.3))
+        assert np.allclose(matrix.toarray(), op.a_plus_adag(4, 0.3))
+        number_op = op.number_sparse(4, np.array(2.0))
+        assert np.allclose(number_op.toarray(), op.number(4, 2.0))
+
+    @pytest.mark.parametrize("dimension", [1, 2, 7])
+    def test_annihilation_sparse(self, dimension):
+        expected = sp.sparse.dia_matrix(
+            (np.sqrt(range(dimension)), [1]), shape=(dimension, dimension)
+        ).tocsc()
+        assert_same_sparse(op.annihilation_sparse(dimension), expected)
+
+    @pytest.mark.parametrize("dimension", [1, 2, 7])
+    @pytest.mark.parametrize("prefactor", [None, 0.5])
+    def test_number_sparse(self, dimension, prefactor):
+        diag_elements = np.arange(dimension, dtype=np.float64)
+        if prefactor:
+            diag_elements *= prefactor
+        expected = sp.sparse.dia_matrix(
+            (diag_elements, [0]), shape=(dimension, dimension), dtype=np.float64
+        ).tocsc()
+        assert_same_sparse(op.number_sparse(dimension, prefactor), expected)
+
+    def test_number_sparse_complex_prefactor(self):
+        number_op = op.number_sparse(3, 0.5j)
+        assert number_op.dtype == np.complex128
+        assert np.array_equal(number_op.toarray(), np.diag([0.0, 0.5j, 1.0j]))
+
+    @pytest.mark.parametrize("dimension", [1, 2, 7])
+    @pytest.mark.parametrize("prefactor", [None, 0.5, 0.3 + 0.2j])
+    def test_iadag_minus_ia_sparse(self, dimension, prefactor):
+        scale = prefactor if prefactor is not None else 1.0
+        expected = scale * (
+            1j * sp.sparse.csc_matrix(op.creation(dimension))
+            - 1j * sp.sparse.csc_matrix(op.annihilation(dimension))
+        )
+        assert_same_sparse(op.iadag_minus_ia_sparse(dimension, prefactor), expected)
+        assert np.array_equal(
+            op.iadag_minus_ia(dimension, prefactor), expected.toarray()
+        )
@@ -0,0 +1,27 @@
+# test_oscillator.py
+# meant to be run with 'pytest'
+#
+# This file is part of scqubits: a Python package for superconducting qubits,
+# Quantum 5, 583 (2021). https://quantum-journal.org/papers/q-2021-11-17-583/
+#
+#    Copyright (c) 2019 and later, Jens Koch and Peter Groszkowski
+#    All rights reserved.
+#
+#    This source code is licensed under the BSD-style license found in the
+#    LICENSE file in the root directory of this source tree.
+############################################################################
+
+import numpy as np
+import pytest
+
+import scqubits.core.oscillator as osc
+
+
+class TestOscillator:
+    @pytest.mark.parametrize("n_max", [0, 1, 2, 30])
+    def test_harm_osc_wavefunctions(self, n_max):
+        x = np.linspace(-6.0, 6.0, 101)
+        wavefunctions = osc.harm_osc_wavefunctions(n_max, x, 1.3)
+        assert wavefunctions.shape == (n_max, x.size)
+        for n in range(n_max):
+            assert np.allclose(wavefunctions[n], osc.harm_osc_wavefunction(n, x, 1.3))